@@ -1,21 +1,46 @@
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
 import os
+import asyncio
+import bisect
+import hashlib
+import itertools
 import logging
+import queue
+import uuid
+import aiofiles
+import orjson
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
 # Setup logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('app.log')
-    ]
-)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def _build_log_handlers():
+    """Console and file handlers that actually write log output"""
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.StreamHandler(), logging.FileHandler('app.log')]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    return handlers
+
+
+# Request handlers only enqueue records; a background thread does the I/O
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, *_build_log_handlers(), respect_handler_level=True)
+_log_listener.start()
+
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=LOG_LEVEL, handlers=[_queue_handler])
 
 # Set third-party library logging levels
 logging.getLogger('sentence_transformers').setLevel(logging.WARNING)
@@ -24,12 +49,23 @@ logging.getLogger('torch').setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
-from project.question_selector import select_questions
+from project.question_selector import select_questions, to_ui_question, QUESTIONS_UI
 from project.hr_selector import select_hr_questions
-from project.judge import score_resume, score_coding_answers
+from project.judge import score_resume_with_status, grade_question, combine_question_grades, JUDGE_IN_PROCESS
 
+try:
+    from hiring_orchestrator import process_application
+    _HAS_ORCHESTRATOR = True
+except Exception as e:
+    logger.warning("Orchestrator unavailable: %s", e)
+    _HAS_ORCHESTRATOR = False
 
-app = FastAPI(title="AI Hiring Assistant API", version="1.0.0")
+
+app = FastAPI(
+    title="AI Hiring Assistant API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
 
 # CORS Configuration
 app.add_middleware(
@@ -43,10 +79,36 @@ app.add_middleware(
 # Configuration
 UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', 'resume')
 MAX_UPLOAD_SIZE = 16 * 1024 * 1024  # 16MB
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+RESUME_SCORE_CACHE_SIZE = 1024
+# Each worker loads its own copy of torch + the embedding model, so keep this
+# small; the pool is only for resume scoring and in-process judging
+CPU_POOL_WORKERS = int(os.getenv('CPU_POOL_WORKERS', min(2, os.cpu_count() or 1)))
+# Threads that wait on judge subprocesses (one per question being graded)
+JUDGE_THREADS = int(os.getenv('JUDGE_THREADS', 8))
 
 # Ensure upload folder exists
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+def _init_worker_logging():
+    """Pool workers have no queue listener thread, so they log directly"""
+    logging.getLogger().handlers[:] = _build_log_handlers()
+
+
+def _new_cpu_pool():
+    return ProcessPoolExecutor(max_workers=CPU_POOL_WORKERS, initializer=_init_worker_logging)
+
+
+# Worker pool for resume scoring (parsing/embeddings) and, with
+# JUDGE_IN_PROCESS, code judging. Work that only waits on subprocesses or
+# I/O must not go here: the pool is small and every slot it holds delays
+# resume scoring for other applicants.
+CPU_POOL = _new_cpu_pool()
+
+# Subprocess judging only writes to the worker's pipe and waits, so threads
+# are enough and keep slow submissions from holding CPU_POOL slots
+JUDGE_POOL = ThreadPoolExecutor(max_workers=JUDGE_THREADS, thread_name_prefix="judge")
+
 logger.info("FastAPI initialized")
 
 
@@ -77,10 +139,15 @@ class HRSubmission(BaseModel):
 # MOCK DATABASES
 # =========================================================
 
+# Each applicant is stored once as a candidate record; the applicant id
+# and the candidate id are the same, and CODING_SESSIONS is keyed by it.
 CANDIDATES_DB = []
-APPLICANTS_DB = []
+CANDIDATES_BY_ID: dict[int, dict] = {}
 CODING_SESSIONS = {}
 
+# Monotonic id source; ids never depend on how many records exist
+_CANDIDATE_IDS = itertools.count(1)
+
 JOBS_DB = {
     "default": {
         "role": "Senior Backend Engineer",
@@ -96,6 +163,36 @@ JOBS_DB = {
 # HELPERS
 # =========================================================
 
+# Score thresholds (ascending) and the verdict for each band
+AI_SCORE_THRESHOLDS = (40, 60, 80)
+AI_SCORE_VERDICTS = (
+    "Below threshold",
+    "Borderline - manual review",
+    "Promising profile",
+    "Strong match - highly recommended",
+)
+
+def _build_final_score_weights():
+    """Normalized (resume, coding, hr) weights for every combination of completed phases"""
+    table = {}
+    for mask in range(8):
+        weights = (0.30 if mask & 1 else 0, 0.40 if mask & 2 else 0, 0.30 if mask & 4 else 0)
+        total = sum(weights) or 1
+        table[mask] = tuple(w / total for w in weights)
+    return table
+
+
+FINAL_SCORE_WEIGHTS = _build_final_score_weights()
+
+FINAL_SCORE_THRESHOLDS = (40, 50, 65, 80)
+FINAL_SCORE_VERDICTS = (
+    "Poor match - not recommended",
+    "Below average - manual review",
+    "Moderate match - consider",
+    "Good match - recommended",
+    "Strong match - highly recommended",
+)
+
 def compute_ai_score_and_verdict(resume_score: int,
                                  coding_score: Optional[int]) -> tuple[int, str]:
 
@@ -104,14 +201,7 @@ def compute_ai_score_and_verdict(resume_score: int,
     else:
         ai_score = int((resume_score + coding_score) / 2)
 
-    if ai_score >= 80:
-        verdict = "Strong match - highly recommended"
-    elif ai_score >= 60:
-        verdict = "Promising profile"
-    elif ai_score >= 40:
-        verdict = "Borderline - manual review"
-    else:
-        verdict = "Below threshold"
+    verdict = AI_SCORE_VERDICTS[bisect.bisect_right(AI_SCORE_THRESHOLDS, ai_score)]
 
     return ai_score, verdict
 
@@ -123,72 +213,157 @@ def compute_final_score(resume_score: int, coding_score: Optional[int], hr_score
     - Coding Score: 40%
     - HR Score: 30%
     """
-    scores = []
-    weights = []
-    
-    if resume_score is not None:
-        scores.append(resume_score)
-        weights.append(0.30)
-    
-    if coding_score is not None:
-        scores.append(coding_score)
-        weights.append(0.40)
-    
-    if hr_score is not None:
-        scores.append(hr_score)
-        weights.append(0.30)
-    
-    # Normalize weights if not all phases are complete
-    if weights:
-        total_weight = sum(weights)
-        weights = [w / total_weight for w in weights]
-        final_score = sum(s * w for s, w in zip(scores, weights))
-    else:
-        final_score = 0
-    
-    final_score = int(final_score)
-    
-    if final_score >= 80:
-        verdict = "Strong match - highly recommended"
-    elif final_score >= 65:
-        verdict = "Good match - recommended"
-    elif final_score >= 50:
-        verdict = "Moderate match - consider"
-    elif final_score >= 40:
-        verdict = "Below average - manual review"
-    else:
-        verdict = "Poor match - not recommended"
+    r = resume_score or 0
+    c = coding_score or 0
+    h = hr_score or 0
+    mask = ((resume_score is not None)
+            | (coding_score is not None) << 1
+            | (hr_score is not None) << 2)
+
+    # Weights are renormalized over the completed phases
+    wr, wc, wh = FINAL_SCORE_WEIGHTS[mask]
+    final_score = int(r * wr + c * wc + h * wh)
+    verdict = FINAL_SCORE_VERDICTS[bisect.bisect_right(FINAL_SCORE_THRESHOLDS, final_score)]
     
     return final_score, verdict
 
 
+async def run_in_cpu_pool(func, *args):
+    """
+    Run CPU-bound work in the process pool without blocking the event loop.
+    Only for resume scoring (score_resume_with_status, process_application) and
+    JUDGE_IN_PROCESS grading; subprocess judging and other waiting-only work
+    belong on threads (see JUDGE_POOL).
+    """
+    global CPU_POOL
+    loop = asyncio.get_running_loop()
+    pool = CPU_POOL
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        # A dead worker (OOM kill, os._exit in judged code) breaks the executor
+        # for good; replace it once and retry the call on the new pool
+        if CPU_POOL is pool:
+            logger.warning("CPU pool broken, starting a new one")
+            pool.shutdown(wait=False)
+            CPU_POOL = _new_cpu_pool()
+        return await loop.run_in_executor(CPU_POOL, func, *args)
+
+
+# Resume scores keyed by SHA-256 of the file content (LRU order)
+_RESUME_SCORE_CACHE: "OrderedDict[str, int]" = OrderedDict()
+
+
+def get_cached_resume_score(resume_sha: str) -> Optional[int]:
+    """Previously computed score for an identical resume file, if any"""
+    score = _RESUME_SCORE_CACHE.get(resume_sha)
+    if score is not None:
+        _RESUME_SCORE_CACHE.move_to_end(resume_sha)
+    return score
+
+
+def cache_resume_score(resume_sha: str, score: int):
+    _RESUME_SCORE_CACHE[resume_sha] = score
+    if len(_RESUME_SCORE_CACHE) > RESUME_SCORE_CACHE_SIZE:
+        _RESUME_SCORE_CACHE.popitem(last=False)
+
+
+async def score_resume_cached(resume_path: str, resume_sha: str) -> int:
+    """Score a resume, reusing the result for previously seen identical files"""
+    score = get_cached_resume_score(resume_sha)
+    if score is None:
+        score, complete = await run_in_cpu_pool(score_resume_with_status, resume_path)
+        # Fallback scores (e.g. model unavailable) are served but not cached,
+        # so the file is scored properly once the model is back
+        if complete:
+            cache_resume_score(resume_sha, score)
+    return score
+
+
+async def grade_coding_answers(questions, answer_map, session_state=None) -> tuple[int, list]:
+    """
+    Grade each answered question concurrently, collecting grades as they finish.
+    With a session_state, each finished question's results are stored in it
+    right away, so the session shows partial results while slower ones run.
+    """
+    async def grade(index, question, code):
+        if JUDGE_IN_PROCESS:
+            # In-process judging needs a main thread for its SIGALRM timeout
+            return index, await run_in_cpu_pool(grade_question, question, code)
+        loop = asyncio.get_running_loop()
+        return index, await loop.run_in_executor(JUDGE_POOL, grade_question, question, code)
+
+    tasks = [
+        asyncio.create_task(grade(i, q, answer_map[q.get("id")]))
+        for i, q in enumerate(questions)
+        if answer_map.get(q.get("id")) and q.get("test_cases")
+    ]
+
+    grades = {}
+    for next_done in asyncio.as_completed(tasks):
+        index, question_grade = await next_done
+        grades[index] = question_grade
+        if session_state is not None:
+            session_state["coding_test_results"] = combine_question_grades(
+                [grades[i] for i in sorted(grades)]
+            )[1]
+
+    # Report results in question order regardless of completion order
+    return combine_question_grades([grades[i] for i in sorted(grades)])
+
+
 def get_candidate_by_id(cid):
-    for c in CANDIDATES_DB:
-        if c["id"] == cid:
-            return c
-    return None
+    return CANDIDATES_BY_ID.get(cid)
+
+
+def stream_json_array(items) -> StreamingResponse:
+    """Stream an iterable as a JSON array, encoding one element at a time"""
+    async def generate():
+        # Separator and element go out as one chunk (one send per record)
+        separator = b"["
+        for item in items:
+            yield separator + orjson.dumps(item)
+            separator = b","
+        yield b"]" if separator == b"," else b"[]"
+
+    return StreamingResponse(generate(), media_type="application/json")
 
 
 def format_questions_for_ui(questions):
     """Transform questions from storage format to UI format"""
-    formatted = []
-    for q in questions:
-        formatted_q = {
+    return [QUESTIONS_UI.get(q.get("id")) or to_ui_question(q) for q in questions]
+
+
+def format_hr_questions_for_ui(hr_questions):
+    """Transform HR questions from storage format to UI format"""
+    return [
+        {
             "id": q.get("id"),
-            "question": q.get("description") or q.get("title"),  # Use description, fallback to title
-            "title": q.get("title"),
-            "difficulty": q.get("difficulty"),
-            "function_signature": q.get("function_signature"),
-            "topic": q.get("topic")
+            "question": q.get("question"),
+            "category": q.get("category"),
+            "type": q.get("type")
         }
-        formatted.append(formatted_q)
-    return formatted
+        for q in hr_questions
+    ]
 
 
 # =========================================================
 # API ROUTES
 # =========================================================
 
+@app.on_event("shutdown")
+async def shutdown_cpu_pool():
+    """Release the CPU worker pool and judge threads"""
+    CPU_POOL.shutdown(wait=False)
+    JUDGE_POOL.shutdown(wait=False)
+
+
+@app.on_event("shutdown")
+async def stop_log_listener():
+    """Flush queued log records and stop the logging thread"""
+    _log_listener.stop()
+
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint"""
@@ -210,13 +385,25 @@ async def get_dashboard_stats():
     """Get dashboard statistics"""
     total = len(CANDIDATES_DB)
 
+    # Single pass over the candidates for all counters
+    approved = rejected = pending = 0
+    score_sum = 0
+    for c in CANDIDATES_DB:
+        status = c.get("status")
+        if status == "approved":
+            approved += 1
+        elif status == "rejected":
+            rejected += 1
+        elif status == "pending":
+            pending += 1
+        score_sum += c.get("ai_score", 0)
+
     stats = {
         "total": total,
-        "approved": len([c for c in CANDIDATES_DB if c.get("status") == "approved"]),
-        "rejected": len([c for c in CANDIDATES_DB if c.get("status") == "rejected"]),
-        "pending": len([c for c in CANDIDATES_DB if c.get("status") == "pending"]),
-        "avg_score": round(sum([c.get("ai_score", 0) for c in CANDIDATES_DB]) / total, 1)
-        if total else 0
+        "approved": approved,
+        "rejected": rejected,
+        "pending": pending,
+        "avg_score": round(score_sum / total, 1) if total else 0
     }
 
     return {
@@ -238,79 +425,104 @@ async def submit_application(
     """Submit applicant application with resume"""
     try:
         resume_path = None
+        resume_sha = None
         filename = None
 
         if resume:
             filename = resume.filename
-            resume_path = os.path.join(UPLOAD_FOLDER, filename)
+            # Never write to the client's filename: concurrent uploads with the
+            # same name would overwrite each other before being scored
+            extension = os.path.splitext(filename or "")[1].lower()
+            upload_path = os.path.join(UPLOAD_FOLDER, f"{uuid.uuid4().hex}.part")
             
-            # Save uploaded file
-            with open(resume_path, "wb") as buffer:
-                content = await resume.read()
-                buffer.write(content)
+            try:
+                # Stream uploaded file to disk in chunks
+                bytes_written = 0
+                digest = hashlib.sha256()
+                async with aiofiles.open(upload_path, "wb") as buffer:
+                    while chunk := await resume.read(UPLOAD_CHUNK_SIZE):
+                        bytes_written += len(chunk)
+                        if bytes_written > MAX_UPLOAD_SIZE:
+                            break
+                        digest.update(chunk)
+                        await buffer.write(chunk)
+
+                if bytes_written > MAX_UPLOAD_SIZE:
+                    raise HTTPException(status_code=413, detail="Resume exceeds maximum upload size")
+
+                # Stored under its content hash, so the scored bytes always match the cache key
+                resume_sha = digest.hexdigest()
+                resume_path = os.path.join(UPLOAD_FOLDER, resume_sha + extension)
+                os.replace(upload_path, resume_path)
+            finally:
+                # Oversized upload, write error or cancelled request: no orphaned .part file
+                if os.path.exists(upload_path):
+                    os.remove(upload_path)
+
+        # Identical resumes skip parsing and embedding on every path
+        resume_score = get_cached_resume_score(resume_sha) if resume_sha else None
 
         # Use hiring orchestrator for complete pipeline
-        try:
-            from hiring_orchestrator import process_application
-            
+        pipeline_result = None
+        if _HAS_ORCHESTRATOR and resume_score is None:
             applicant_data = {
                 "name": name,
                 "email": email
             }
-            
-            pipeline_result = process_application(resume_path, applicant_data)
-            
-            if not pipeline_result["success"]:
-                # Fallback to basic processing
-                resume_score = score_resume(resume_path) if resume_path else 50
-                ai_score, verdict = compute_ai_score_and_verdict(resume_score, None)
-                questions = select_questions(resume_score, n=3)
-            else:
-                candidate_data = pipeline_result["candidate_data"]
-                resume_score = candidate_data["resume_score"]
-                ai_score, verdict = compute_ai_score_and_verdict(resume_score, None)
-                questions = candidate_data["questions"]
-        except Exception as e:
-            logger.error(f"Orchestrator error: {e}")
-            resume_score = score_resume(resume_path) if resume_path else 50
-            ai_score, verdict = compute_ai_score_and_verdict(resume_score, None)
+
+            try:
+                pipeline_result = await run_in_cpu_pool(process_application, resume_path, applicant_data)
+            except Exception as e:
+                logger.error(f"Orchestrator error: {e}")
+
+        if pipeline_result and pipeline_result["success"]:
+            candidate_data = pipeline_result["candidate_data"]
+            resume_score = candidate_data["resume_score"]
+            questions = candidate_data["questions"]
+            if resume_sha and candidate_data.get("resume_score_complete"):
+                cache_resume_score(resume_sha, resume_score)
+        else:
+            # Fallback to basic processing
+            if resume_score is None:
+                resume_score = await score_resume_cached(resume_path, resume_sha) if resume_path else 50
             questions = select_questions(resume_score, n=3)
 
-        applicant_id = len(APPLICANTS_DB) + 1
+        ai_score, verdict = compute_ai_score_and_verdict(resume_score, None)
+
+        # Everything from id allocation to the last insert runs without an
+        # await, so concurrent submissions cannot interleave here.
+        candidate_id = next(_CANDIDATE_IDS)
 
-        # Store complete applicant data
-        applicant_record = {
-            "id": applicant_id,
+        # Store complete candidate data
+        candidate_record = {
+            "id": candidate_id,
             "name": name,
             "email": email,
             "resume_score": resume_score,
+            "coding_score": None,
+            "hr_score": None,
+            "final_score": None,
             "ai_score": ai_score,
             "ai_verdict": verdict,
             "status": "pending",
             "stage": "Coding Assessment",
             "resume_filename": filename
         }
-        
-        APPLICANTS_DB.append(applicant_record)
 
-        candidate_id = len(CANDIDATES_DB) + 1
+        CANDIDATES_DB.append(candidate_record)
+        CANDIDATES_BY_ID[candidate_id] = candidate_record
 
-        CANDIDATES_DB.append({
-            "id": candidate_id,
-            "name": name,
-            "email": email,
-            "resume_score": resume_score,
-            "coding_score": None,
-            "ai_score": ai_score,
-            "status": "pending"
-        })
+        hr_questions = select_hr_questions(n=4)
 
-        CODING_SESSIONS[applicant_id] = {
+        # UI projections are computed once here and served as-is afterwards
+        session_state = {
             "questions": questions,
+            "questions_ui": format_questions_for_ui(questions),
             "resume_score": resume_score,
             "coding_score": None,
             "coding_test_results": [],
-            "hr_questions": select_hr_questions(n=4),
+            "hr_questions": hr_questions,
+            "hr_questions_ui": format_hr_questions_for_ui(hr_questions),
             "hr_score": None,
             "hr_answers": {},
             "ai_score": ai_score,
@@ -319,12 +531,16 @@ async def submit_application(
             "assessment_stage": "coding"  # Track which phase: coding, hr, completed
         }
 
+        CODING_SESSIONS[candidate_id] = session_state
+
         return {
             "success": True,
-            "applicant_id": applicant_id,
-            "applicant": applicant_record
+            "applicant_id": candidate_id,
+            "applicant": candidate_record
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Application submission error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -333,7 +549,7 @@ async def submit_application(
 @app.get("/api/applicant/{applicant_id}")
 async def get_applicant(applicant_id: int):
     """Get applicant data"""
-    applicant = next((a for a in APPLICANTS_DB if a["id"] == applicant_id), None)
+    applicant = get_candidate_by_id(applicant_id)
     
     if not applicant:
         raise HTTPException(status_code=404, detail="Applicant not found")
@@ -349,10 +565,8 @@ async def get_coding_questions(applicant_id: int):
     if not session_state:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    formatted_questions = format_questions_for_ui(session_state["questions"])
-
     return {
-        "questions": formatted_questions,
+        "questions": session_state["questions_ui"],
         "resume_score": session_state["resume_score"],
         "coding_score": session_state["coding_score"],
         "ai_score": session_state["ai_score"],
@@ -369,19 +583,9 @@ async def submit_coding_answers(applicant_id: int, submission: CodingSubmission)
     if not session_state:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Convert Pydantic models to dict format expected by judge
-    answers = [{"question_id": ans.question_id, "answer": ans.answer} 
-               for ans in submission.answers]
+    answer_map = {ans.question_id: ans.answer for ans in submission.answers}
 
-    questions = session_state["questions"]
-
-    result = score_coding_answers(questions, answers)
-
-    if isinstance(result, tuple):
-        coding_score, test_details = result
-    else:
-        coding_score = result
-        test_details = []
+    coding_score, test_details = await grade_coding_answers(session_state["questions"], answer_map, session_state)
 
     # Store results
     session_state["coding_score"] = coding_score
@@ -394,22 +598,12 @@ async def submit_coding_answers(applicant_id: int, submission: CodingSubmission)
     if candidate:
         candidate["coding_score"] = coding_score
 
-    hr_questions = [
-        {
-            "id": q.get("id"),
-            "question": q.get("question"),
-            "category": q.get("category"),
-            "type": q.get("type")
-        }
-        for q in session_state["hr_questions"]
-    ]
-
     return {
         "success": True,
         "coding_score": coding_score,
         "test_results": test_details,
         "next_stage": "hr",
-        "hr_questions": hr_questions
+        "hr_questions": session_state["hr_questions_ui"]
     }
 
 
@@ -421,18 +615,8 @@ async def get_hr_questions(applicant_id: int):
     if not session_state:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    hr_questions = [
-        {
-            "id": q.get("id"),
-            "question": q.get("question"),
-            "category": q.get("category"),
-            "type": q.get("type")
-        }
-        for q in session_state["hr_questions"]
-    ]
-
     return {
-        "hr_questions": hr_questions,
+        "hr_questions": session_state["hr_questions_ui"],
         "coding_score": session_state["coding_score"],
         "assessment_stage": session_state["assessment_stage"]
     }
@@ -486,6 +670,23 @@ async def submit_hr_answers(applicant_id: int, submission: HRSubmission):
     }
 
 
+def _hr_length_score_total(word_counts) -> int:
+    """Sum the length-based scores for a sequence of answer word counts"""
+    total = 0
+    for wc in word_counts:
+        if wc >= 50:
+            total += 100
+        elif wc >= 30:
+            total += 85
+        elif wc >= 15:
+            total += 70
+        elif wc >= 5:
+            total += 50
+        else:
+            total += 20
+    return total
+
+
 def calculate_hr_score(hr_answers: dict) -> int:
     """
     Calculate HR score based on response quality.
@@ -498,32 +699,14 @@ def calculate_hr_score(hr_answers: dict) -> int:
     if not hr_answers:
         return 0
 
-    total_score = 0
-    num_answers = 0
-
-    for question_id, answer in hr_answers.items():
-        if answer and isinstance(answer, str):
-            num_answers += 1
-            # Award points based on response length
-            word_count = len(answer.split())
-            
-            if word_count >= 50:
-                score = 100
-            elif word_count >= 30:
-                score = 85
-            elif word_count >= 15:
-                score = 70
-            elif word_count >= 5:
-                score = 50
-            else:
-                score = 20
-            
-            total_score += score
+    # Award points based on response length
+    word_counts = [len(answer.split()) for answer in hr_answers.values()
+                   if answer and isinstance(answer, str)]
 
-    if num_answers == 0:
+    if not word_counts:
         return 0
 
-    hr_score = int(total_score / num_answers)
+    hr_score = int(_hr_length_score_total(word_counts) / len(word_counts))
     return min(max(hr_score, 0), 100)
 
 
@@ -534,21 +717,7 @@ def calculate_hr_score(hr_answers: dict) -> int:
 @app.get("/api/candidates")
 async def get_candidates():
     """Get all candidates"""
-    all_candidates = []
-    
-    for candidate in CANDIDATES_DB:
-        # Find matching applicant data
-        applicant = next((a for a in APPLICANTS_DB if a.get("name") == candidate.get("name")), None)
-        
-        # Merge data
-        merged = {
-            **candidate,
-            "stage": applicant.get("stage", "Unknown") if applicant else "Unknown",
-            "ai_verdict": applicant.get("ai_verdict", "N/A") if applicant else "N/A"
-        }
-        all_candidates.append(merged)
-    
-    return all_candidates
+    return stream_json_array(CANDIDATES_DB)
 
 
 @app.get("/api/candidate/{candidate_id}")
@@ -559,23 +728,10 @@ async def get_candidate_detail(candidate_id: int):
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    # Find matching applicant data
-    applicant = next((a for a in APPLICANTS_DB if a.get("name") == candidate.get("name")), None)
-    
-    # Find coding session if exists
-    coding_session = None
-    for app_id, session in CODING_SESSIONS.items():
-        if session.get("candidate_id") == candidate_id:
-            coding_session = session
-            break
-    
     # Merge all data
     full_profile = {
         **candidate,
-        "stage": applicant.get("stage", "Unknown") if applicant else "Unknown",
-        "ai_verdict": applicant.get("ai_verdict", "N/A") if applicant else "N/A",
-        "resume_filename": applicant.get("resume_filename") if applicant else None,
-        "coding_session": coding_session
+        "coding_session": CODING_SESSIONS.get(candidate_id)
     }
     
     return full_profile
@@ -584,23 +740,23 @@ async def get_candidate_detail(candidate_id: int):
 @app.get("/api/assessments")
 async def get_assessments():
     """Get all assessments"""
-    assessments_data = []
-    
-    for app_id, session in CODING_SESSIONS.items():
-        candidate = get_candidate_by_id(session.get("candidate_id"))
-        if candidate:
-            assessments_data.append({
-                "applicant_id": app_id,
-                "candidate_name": candidate.get("name"),
-                "candidate_email": candidate.get("email"),
-                "resume_score": session.get("resume_score", 0),
-                "coding_score": session.get("coding_score"),
-                "ai_score": session.get("ai_score", 0),
-                "num_questions": len(session.get("questions", [])),
-                "completed": session.get("coding_score") is not None
-            })
-    
-    return assessments_data
+    def iter_assessments():
+        # Snapshot the sessions so submissions during streaming are safe
+        for app_id, session in list(CODING_SESSIONS.items()):
+            candidate = CANDIDATES_BY_ID.get(session.get("candidate_id"))
+            if candidate:
+                yield {
+                    "applicant_id": app_id,
+                    "candidate_name": candidate.get("name"),
+                    "candidate_email": candidate.get("email"),
+                    "resume_score": session.get("resume_score", 0),
+                    "coding_score": session.get("coding_score"),
+                    "ai_score": session.get("ai_score", 0),
+                    "num_questions": len(session.get("questions", [])),
+                    "completed": session.get("coding_score") is not None
+                }
+
+    return stream_json_array(iter_assessments())
 
 
 @app.get("/api/jobs")
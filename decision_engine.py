@@ -116,21 +116,28 @@ def determine_next_stage(
         return "Unknown Stage"
 
 
-def generate_recommendation(candidate_data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Generate hiring recommendation with detailed reasoning.
-    
-    Args:
-        candidate_data: Complete candidate information
-    
-    Returns:
-        Recommendation dict with decision, reasoning, and next steps
-    """
-    resume_score = candidate_data.get("resume_score", 0)
-    coding_score = candidate_data.get("coding_score")
-    fraud_score = candidate_data.get("fraud_score", 0)
-    final_score = candidate_data.get("final_score", 0)
-    
+# Decision bands by minimum final score, highest first: (min, decision, verdict, next_steps)
+_DECISION_BANDS = (
+    (75, "STRONG HIRE", "Excellent candidate - highly recommended",
+     ("Schedule technical interview", "Fast-track to hiring manager")),
+    (60, "PROCEED WITH CAUTION", "Borderline candidate - requires manual review",
+     ("Manual review by senior engineer", "Additional screening may be needed")),
+    (40, "WEAK CANDIDATE", "Below threshold but not auto-rejected",
+     ("Consider for junior positions", "May need additional training")),
+)
+_LOW_SCORE_DECISION = ("REJECT", "Does not meet minimum requirements",
+                       ("Send rejection email", "Keep in talent pool for future opportunities"))
+_FRAUD_DECISION = ("REJECT", "High fraud risk detected",
+                   ("Flag for manual review", "Do not proceed with interview"))
+
+
+def _build_recommendation(
+    resume_score: int,
+    coding_score: Optional[int],
+    fraud_score: int,
+    final_score: int
+) -> Dict[str, Any]:
+    """Recommendation from already-extracted scores (see generate_recommendation)."""
     reasons = []
     strengths = []
     weaknesses = []
@@ -162,25 +169,12 @@ def generate_recommendation(candidate_data: Dict[str, Any]) -> Dict[str, Any]:
     
     # Make decision
     if fraud_score > 70:
-        decision = "REJECT"
-        verdict = "High fraud risk detected"
-        next_steps = ["Flag for manual review", "Do not proceed with interview"]
-    elif final_score >= 75:
-        decision = "STRONG HIRE"
-        verdict = "Excellent candidate - highly recommended"
-        next_steps = ["Schedule technical interview", "Fast-track to hiring manager"]
-    elif final_score >= 60:
-        decision = "PROCEED WITH CAUTION"
-        verdict = "Borderline candidate - requires manual review"
-        next_steps = ["Manual review by senior engineer", "Additional screening may be needed"]
-    elif final_score >= 40:
-        decision = "WEAK CANDIDATE"
-        verdict = "Below threshold but not auto-rejected"
-        next_steps = ["Consider for junior positions", "May need additional training"]
+        decision, verdict, next_steps = _FRAUD_DECISION
     else:
-        decision = "REJECT"
-        verdict = "Does not meet minimum requirements"
-        next_steps = ["Send rejection email", "Keep in talent pool for future opportunities"]
+        decision, verdict, next_steps = next(
+            (band[1:] for band in _DECISION_BANDS if final_score >= band[0]),
+            _LOW_SCORE_DECISION
+        )
     
     return {
         "decision": decision,
@@ -189,11 +183,29 @@ def generate_recommendation(candidate_data: Dict[str, Any]) -> Dict[str, Any]:
         "strengths": strengths,
         "weaknesses": weaknesses,
         "reasons": reasons,
-        "next_steps": next_steps,
+        "next_steps": list(next_steps),
         "recommendation_summary": f"{decision}: {verdict} (Final Score: {final_score}/100)"
     }
 
 
+def generate_recommendation(candidate_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate hiring recommendation with detailed reasoning.
+    
+    Args:
+        candidate_data: Complete candidate information
+    
+    Returns:
+        Recommendation dict with decision, reasoning, and next steps
+    """
+    return _build_recommendation(
+        candidate_data.get("resume_score", 0),
+        candidate_data.get("coding_score"),
+        candidate_data.get("fraud_score", 0),
+        candidate_data.get("final_score", 0)
+    )
+
+
 def apply_job_requirements(
     scores: Dict[str, int],
     job_config: Dict[str, Any]
@@ -203,19 +215,21 @@ def apply_job_requirements(
     
     Args:
         scores: Candidate scores
-        job_config: Job requirements and thresholds
+        job_config: Job requirements and thresholds (optionally with a
+            precomputed "skills_set" frozenset of the required skills)
     
     Returns:
         Match analysis
     """
-    required_skills = job_config.get("skills", [])
-    candidate_skills = job_config.get("candidate_skills", [])
+    # Jobs matched against many candidates can carry a prebuilt "skills_set"
+    required_skills = job_config.get("skills_set") or frozenset(job_config.get("skills", []))
+    candidate_skills = frozenset(job_config.get("candidate_skills", []))
     min_score = job_config.get("min_score", 60)
     risk_tolerance = job_config.get("risk_tolerance", 50)
     
     # Calculate skill match
-    matched_skills = list(set(required_skills) & set(candidate_skills))
-    missing_skills = list(set(required_skills) - set(candidate_skills))
+    matched_skills = list(required_skills & candidate_skills)
+    missing_skills = list(required_skills - candidate_skills)
     skill_match_percentage = (len(matched_skills) / len(required_skills) * 100) if required_skills else 100
     
     # Check if meets minimum requirements
@@ -249,27 +263,28 @@ def make_final_decision(candidate_data: Dict[str, Any], job_config: Optional[Dic
     Returns:
         Complete decision report
     """
+    # Read each input once and share it across all the analysis steps
+    resume_score = candidate_data.get("resume_score", 0)
+    coding_score = candidate_data.get("coding_score")
+    fraud_score = candidate_data.get("fraud_score", 0)
+    
     # Calculate final score
-    final_score = calculate_final_score(
-        candidate_data.get("resume_score", 0),
-        candidate_data.get("coding_score"),
-        candidate_data.get("fraud_score", 0)
-    )
+    final_score = calculate_final_score(resume_score, coding_score, fraud_score)
     
     candidate_data["final_score"] = final_score
     
     # Generate recommendation
-    recommendation = generate_recommendation(candidate_data)
+    recommendation = _build_recommendation(resume_score, coding_score, fraud_score, final_score)
     
     # Determine next stage
     next_stage = determine_next_stage(
         candidate_data.get("current_stage", "Resume Screening"),
         {
-            "resume_score": candidate_data.get("resume_score", 0),
-            "coding_score": candidate_data.get("coding_score"),
+            "resume_score": resume_score,
+            "coding_score": coding_score,
             "final_score": final_score
         },
-        candidate_data.get("fraud_score", 0)
+        fraud_score
     )
     
     # Apply job requirements if provided
@@ -278,7 +293,7 @@ def make_final_decision(candidate_data: Dict[str, Any], job_config: Optional[Dic
         job_match = apply_job_requirements(
             {
                 "final_score": final_score,
-                "fraud_score": candidate_data.get("fraud_score", 0)
+                "fraud_score": fraud_score
             },
             job_config
         )
@@ -8,6 +8,8 @@ Detects suspicious patterns in candidate submissions including:
 """
 
 import difflib
+import functools
+import re
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
@@ -20,18 +22,25 @@ KNOWN_PATTERNS = {
 }
 
 
+_COMMENT_RE = re.compile(r'#[^\n]*')
+
+
+@functools.lru_cache(maxsize=1024)
 def normalize_code(code: str) -> str:
     """Remove whitespace and comments for comparison."""
-    lines = []
-    for line in code.split('\n'):
-        # Remove comments
-        if '#' in line:
-            line = line[:line.index('#')]
-        # Remove whitespace
-        line = line.strip()
-        if line:
-            lines.append(line)
-    return '\n'.join(lines)
+    # Strip comments in one pass, then drop surrounding whitespace and blank lines
+    stripped = (line.strip() for line in _COMMENT_RE.sub('', code).split('\n'))
+    return '\n'.join(line for line in stripped if line)
+
+
+def _compile_patterns(patterns: List[str]):
+    """One regex alternation over the normalized patterns of a question."""
+    normalized = [normalize_code(pattern) for pattern in patterns]
+    return re.compile("|".join(map(re.escape, normalized))), len(patterns)
+
+
+# Compiled once at import: question_id -> (regex, number of patterns)
+COMPILED_PATTERNS = {qid: _compile_patterns(patterns) for qid, patterns in KNOWN_PATTERNS.items()}
 
 
 def detect_code_plagiarism(code: str, question_id: int) -> Dict[str, Any]:
@@ -48,20 +57,27 @@ def detect_code_plagiarism(code: str, question_id: int) -> Dict[str, Any]:
             "reason": "No patterns available for comparison"
         }
     
+    # The same submission is re-examined across stages; reuse the cached result
+    return dict(_plagiarism_result(code, question_id))
+
+
+@functools.lru_cache(maxsize=1024)
+def _plagiarism_result(code: str, question_id: int):
+    """Cached plagiarism check; returns the result as a tuple of items."""
     normalized = normalize_code(code)
-    patterns = KNOWN_PATTERNS[question_id]
+    pattern_re, total_patterns = COMPILED_PATTERNS[question_id]
     
-    # Check how many known patterns appear in the code
-    matches = sum(1 for pattern in patterns if pattern in normalized)
-    similarity = (matches / len(patterns)) * 100
+    # Check how many distinct known patterns appear in the code (single scan)
+    matches = len(set(pattern_re.findall(normalized)))
+    similarity = (matches / total_patterns) * 100
     
     is_suspicious = similarity > 80
     
-    return {
-        "is_suspicious": is_suspicious,
-        "similarity_score": round(similarity, 2),
-        "reason": f"Code matches {matches}/{len(patterns)} known patterns" if is_suspicious else "Code appears original"
-    }
+    return (
+        ("is_suspicious", is_suspicious),
+        ("similarity_score", round(similarity, 2)),
+        ("reason", f"Code matches {matches}/{total_patterns} known patterns" if is_suspicious else "Code appears original"),
+    )
 
 
 def analyze_submission_timing(
@@ -142,13 +158,15 @@ def check_resume_authenticity(resume_data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def calculate_fraud_score(checks: List[Dict[str, Any]]) -> int:
+def calculate_fraud_score(checks: List[Dict[str, Any]], total_checks: Optional[int] = None) -> int:
     """
     Calculate overall fraud risk score (0-100).
     Higher score = higher fraud risk.
     
     Args:
         checks: List of fraud check results
+        total_checks: Number of checks the score is out of (default: len(checks));
+            checks not in the list are counted as not suspicious
     
     Returns:
         Fraud score (0-100)
@@ -156,16 +174,24 @@ def calculate_fraud_score(checks: List[Dict[str, Any]]) -> int:
     if not checks:
         return 0
     
-    suspicious_count = sum(1 for check in checks if check.get("is_suspicious", False))
-    total_checks = len(checks)
+    # Count suspicious checks and plagiarism hits in a single pass
+    suspicious_count = 0
+    plagiarism_count = 0
+    for check in checks:
+        if check.get("is_suspicious", False):
+            suspicious_count += 1
+            if "plagiarism" in check.get("reason", "").lower():
+                plagiarism_count += 1
+    
+    if total_checks is None:
+        total_checks = len(checks)
     
     # Base score on percentage of suspicious checks
     base_score = (suspicious_count / total_checks) * 100
     
-    # Weight by severity (if plagiarism detected, increase score)
-    for check in checks:
-        if check.get("is_suspicious") and "plagiarism" in check.get("reason", "").lower():
-            base_score = min(base_score + 20, 100)
+    # Weight by severity (+20 per plagiarism hit, capped at 100)
+    if plagiarism_count:
+        base_score = min(base_score + 20 * plagiarism_count, 100)
     
     return int(base_score)
 
@@ -184,9 +210,13 @@ def run_fraud_detection(
         timing_data: Optional timing information
     
     Returns:
-        Complete fraud analysis report
+        Complete fraud analysis report. Plagiarism checks stop early once the
+        risk level is certain to be HIGH; the report then has partial=True,
+        skipped_checks > 0, and fraud_score is a lower bound (skipped checks
+        counted as not suspicious) rather than the full-run score.
     """
     checks = []
+    total_checks = 1 + len(code_submissions) + (1 if timing_data else 0)
     
     # Check resume authenticity
     resume_check = check_resume_authenticity(resume_data)
@@ -199,6 +229,11 @@ def run_fraud_detection(
             submission.get("question_id", 0)
         )
         checks.append(plagiarism_check)
+        
+        # Remaining checks can only raise the score; once even a clean run of
+        # them still leaves it HIGH, skip the rest of the plagiarism checks
+        if calculate_fraud_score(checks, total_checks) > 70:
+            break
     
     # Check submission timing if available
     if timing_data:
@@ -210,12 +245,19 @@ def run_fraud_detection(
         )
         checks.append(timing_check)
     
-    # Calculate overall fraud score
-    fraud_score = calculate_fraud_score(checks)
+    # Calculate overall fraud score (skipped checks count as not suspicious)
+    fraud_score = calculate_fraud_score(checks, total_checks)
+    skipped_checks = total_checks - len(checks)
+    
+    summary = f"Fraud risk: {fraud_score}/100 - {len([c for c in checks if c.get('is_suspicious')])} suspicious indicators found"
+    if skipped_checks:
+        summary += f" ({skipped_checks} plagiarism checks skipped, score is a lower bound)"
     
     return {
         "fraud_score": fraud_score,
         "risk_level": "HIGH" if fraud_score > 70 else "MEDIUM" if fraud_score > 40 else "LOW",
         "checks": checks,
-        "summary": f"Fraud risk: {fraud_score}/100 - {len([c for c in checks if c.get('is_suspicious')])} suspicious indicators found"
+        "partial": skipped_checks > 0,
+        "skipped_checks": skipped_checks,
+        "summary": summary
     }
@@ -4,7 +4,7 @@ import time
 # resume modules
 from resume.parser import extract_text
 from resume.skill_extractor import extract_skills, extract_experience, count_projects
-from resume.scorer import score_candidate
+from resume.scorer import score_candidate_with_status
 
 # coding modules
 from project.question_selector import select_questions
@@ -28,6 +28,14 @@ JOB_CONFIG = {
 
 def evaluate_resume(path):
 
+    score, data, _ = evaluate_resume_with_status(path)
+
+    return score, data
+
+
+def evaluate_resume_with_status(path):
+    """evaluate_resume plus False if the embedding model was unavailable"""
+
     text = extract_text(path)
 
     data = {
@@ -36,9 +44,9 @@ def evaluate_resume(path):
         "projects": count_projects(text)
     }
 
-    score = score_candidate(data, JOB_CONFIG)
+    score, complete = score_candidate_with_status(data, JOB_CONFIG)
 
-    return score, data
+    return score, data, complete
 
 
 # -----------------------------
@@ -162,7 +170,7 @@ def process_application(resume_path, applicant_data):
             }
         
         # Evaluate resume
-        resume_score, resume_data = evaluate_resume(resume_path)
+        resume_score, resume_data, score_complete = evaluate_resume_with_status(resume_path)
         
         # Select coding questions
         questions = select_questions(resume_score, n=3)
@@ -171,6 +179,7 @@ def process_application(resume_path, applicant_data):
             "success": True,
             "candidate_data": {
                 "resume_score": resume_score,
+                "resume_score_complete": score_complete,
                 "resume_data": resume_data,
                 "questions": questions
             }
@@ -0,0 +1,82 @@
+"""
+Long-lived test runner for a single code submission (used by judge.py).
+
+Protocol, one JSON object per line:
+- stdin, first line:  {"code": <source>, "func_name": <name>}
+- stdin, then:        {"input": {...}} for each test case
+- stdout, per test:   {"stdout": <text>, "stderr": <text>}
+
+The candidate code is compiled and executed once; every test case then
+calls the function in the same namespace. Candidate output is captured
+per test and never written to the protocol stream.
+
+load_code and call_function are also used directly by judge.py's
+trusted in-process mode.
+"""
+
+import io
+import json
+import os
+import sys
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
+
+
+def load_code(code, namespace):
+    """Execute the candidate module body, returning (loaded, stdout, stderr)."""
+    out, err = io.StringIO(), io.StringIO()
+    loaded = False
+    with redirect_stdout(out), redirect_stderr(err):
+        try:
+            exec(compile(code, "<candidate>", "exec"), namespace)
+            loaded = True
+        except SystemExit:
+            pass
+        except BaseException as e:
+            # Report from the candidate's frames only, not this runner's
+            traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+    return loaded, out.getvalue(), err.getvalue()
+
+
+def call_function(func_name, test_input, namespace):
+    """Call the candidate function once, returning (stdout, stderr)."""
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        try:
+            result = eval(func_name, namespace)(**test_input)
+            print(json.dumps(result, default=str))
+        except Exception as e:
+            print(f"ERROR: {str(e)}")
+        except BaseException:
+            pass
+    return out.getvalue(), err.getvalue()
+
+
+def main():
+    # Keep the real stdout for the protocol; anything written to fd 1
+    # directly by candidate code goes to devnull instead.
+    protocol = os.fdopen(os.dup(1), "w")
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    requests = sys.stdin
+    sys.stdin = io.StringIO()
+
+    setup = json.loads(requests.readline())
+    func_name = setup["func_name"]
+    namespace = {"__name__": "__main__"}
+    loaded, load_out, load_err = load_code(setup["code"], namespace)
+
+    for line in requests:
+        test = json.loads(line)
+        if loaded:
+            out, err = call_function(func_name, test["input"], namespace)
+        else:
+            # Module body failed: every test sees the same failure
+            out, err = "", ""
+
+        protocol.write(json.dumps({"stdout": load_out + out, "stderr": load_err + err}) + "\n")
+        protocol.flush()
+
+
+if __name__ == "__main__":
+    main()
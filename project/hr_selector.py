@@ -2,6 +2,11 @@ import json
 import os
 import random
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional: fall back to the standard library parser
+    _json_loads = json.loads
+
 
 BASE_DIR = os.path.dirname(__file__)
 HR_QUESTIONS_PATH = os.path.join(BASE_DIR, "hr_questions.json")
@@ -12,11 +17,12 @@ def _load_hr_questions():
     if not os.path.exists(HR_QUESTIONS_PATH):
         return []
 
-    with open(HR_QUESTIONS_PATH, encoding="utf-8") as f:
-        return json.load(f)
+    with open(HR_QUESTIONS_PATH, "rb") as f:
+        return _json_loads(f.read())
 
 
-HR_QUESTIONS = _load_hr_questions()
+# Loaded once at import and shared by every selection
+HR_QUESTIONS = tuple(_load_hr_questions())
 
 
 def select_hr_questions(n=4):
@@ -32,6 +38,5 @@ def select_hr_questions(n=4):
     if not HR_QUESTIONS:
         return []
 
-    chosen = random.sample(HR_QUESTIONS, min(n, len(HR_QUESTIONS)))
-    random.shuffle(chosen)
-    return chosen
+    # random.sample already returns the picks in random order
+    return random.sample(HR_QUESTIONS, min(n, len(HR_QUESTIONS)))
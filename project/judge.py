@@ -1,9 +1,250 @@
 import subprocess
-import tempfile
+import threading
+import queue
 import os
+import re
 import json
+import signal
 import sys
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple, Optional
+
+from project._judge_worker import load_code, call_function
+
+
+EXECUTION_TIMEOUT = 5  # seconds per test case
+WORKER_PATH = os.path.join(os.path.dirname(__file__), "_judge_worker.py")
+TIMEOUT_ERROR = f"TIMEOUT: Code took too long to execute (>{EXECUTION_TIMEOUT} seconds)"
+
+# Trusted mode: run submissions inside this process instead of a worker
+# subprocess. Only for self-hosted grading of code you trust - candidate
+# code shares the server's interpreter, memory and file system.
+JUDGE_IN_PROCESS = os.getenv('JUDGE_IN_PROCESS', '').lower() in ('1', 'true', 'yes')
+
+
+_DEF_RE = re.compile(r'^\s*def\s+(\w+)\s*\(', re.M)
+
+
+def _find_function_name(code_string: str) -> Optional[str]:
+    """Return the name of the first function defined in the code, if any."""
+    match = _DEF_RE.search(code_string)
+    return match.group(1) if match else None
+
+
+def _same_json_value(actual: Any, expected: Any) -> bool:
+    """Deep equality that also requires matching types (True != 1, 1 != 1.0)."""
+    if type(actual) is not type(expected):
+        return False
+    if isinstance(actual, list):
+        return len(actual) == len(expected) and all(map(_same_json_value, actual, expected))
+    if isinstance(actual, dict):
+        return actual.keys() == expected.keys() and all(
+            _same_json_value(value, expected[key]) for key, value in actual.items()
+        )
+    return actual == expected
+
+
+def _outputs_match(output: str, expected_output: Any) -> bool:
+    """Compare printed output against the expected test case output."""
+    try:
+        actual_output = json.loads(output) if output and not output.startswith("ERROR") else output
+    except ValueError:
+        actual_output = output
+    
+    # Plain == rejects most mismatches in C; the typed walk then rules out
+    # bool/int/float look-alikes. The string comparison covers non-JSON
+    # output and expected values stored as strings.
+    if actual_output == expected_output and _same_json_value(actual_output, expected_output):
+        return True
+    return str(actual_output) == str(expected_output)
+
+
+class _JudgeWorker:
+    """
+    One Python subprocess that loads a submission once and then runs
+    test cases against it (see _judge_worker.py for the protocol).
+    """
+    
+    def __init__(self, code_string: str, func_name: str):
+        self.proc = subprocess.Popen(
+            [sys.executable, WORKER_PATH],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8'
+        )
+        self.replies = queue.Queue()
+        threading.Thread(target=self._read_replies, daemon=True).start()
+        self._send({"code": code_string, "func_name": func_name})
+    
+    def _read_replies(self):
+        for line in self.proc.stdout:
+            self.replies.put(json.loads(line))
+        self.replies.put(None)  # worker exited
+    
+    def _send(self, message: Dict[str, Any]):
+        self.proc.stdin.write(json.dumps(message) + "\n")
+        self.proc.stdin.flush()
+    
+    def run(self, test_input: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """Run one test case and return (output, error); raises TimeoutError."""
+        self._send({"input": test_input})
+        try:
+            reply = self.replies.get(timeout=EXECUTION_TIMEOUT)
+        except queue.Empty:
+            raise TimeoutError
+        
+        if reply is None:
+            raise RuntimeError("judge worker exited unexpectedly")
+        
+        return reply["stdout"].strip(), reply["stderr"].strip() or None
+    
+    def close(self):
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=1)
+        except Exception:
+            self.kill()
+    
+    def kill(self):
+        self.proc.kill()
+        self.proc.wait()
+
+
+class _InProcessTimeout(BaseException):
+    """Raised by the SIGALRM handler; BaseException so `except Exception` in candidate code can't catch it."""
+
+
+def _in_process_available() -> bool:
+    """SIGALRM timers only exist on Unix and can only be set from the main thread."""
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+def _run_test_cases_in_process(code_string: str, func_name: Optional[str],
+                               test_cases: List[Dict[str, Any]]) -> List[Tuple[bool, str, Any]]:
+    """
+    Trusted mode for run_test_cases: compile and exec the code once in this
+    process, then call the function per test case under a SIGALRM timeout.
+    """
+    timed_out = False
+    
+    def on_alarm(signum, frame):
+        nonlocal timed_out
+        timed_out = True
+        raise _InProcessTimeout
+    
+    def timed(func, *args):
+        """Call func under the timeout; returns None if it was interrupted."""
+        nonlocal timed_out
+        timed_out = False
+        try:
+            # Keep re-firing in case the candidate code swallows the first alarm
+            signal.setitimer(signal.ITIMER_REAL, EXECUTION_TIMEOUT, 0.1)
+            try:
+                return func(*args)
+            finally:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        except _InProcessTimeout:
+            return None
+    
+    previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+    results = []
+    namespace = None
+    
+    try:
+        for test_case in test_cases:
+            test_input = test_case.get("input", {})
+            
+            if not isinstance(test_input, dict):
+                results.append((False, "", "Invalid test case format"))
+                continue
+            if not func_name:
+                results.append((False, "", "Could not find function definition"))
+                continue
+            
+            if namespace is None:
+                namespace = {"__name__": "__main__"}
+                loaded, load_out, load_err = timed(load_code, code_string, namespace) or (False, "", "")
+                load_timed_out = timed_out
+            
+            if load_timed_out:
+                results.append((False, "", TIMEOUT_ERROR))
+                continue
+            
+            out, err = (timed(call_function, func_name, test_input, namespace) if loaded else None) or ("", "")
+            if loaded and timed_out:
+                results.append((False, "", TIMEOUT_ERROR))
+                continue
+            
+            output = (load_out + out).strip()
+            error = (load_err + err).strip() or None
+            results.append((_outputs_match(output, test_case.get("output")), output, error))
+    finally:
+        signal.signal(signal.SIGALRM, previous_handler)
+    
+    return results
+
+
+def run_test_cases(code_string: str, test_cases: List[Dict[str, Any]],
+                   in_process: Optional[bool] = None) -> List[Tuple[bool, str, Any]]:
+    """
+    Execute code against several test cases in one reusable subprocess.
+    
+    The interpreter is started and the code is loaded once per submission
+    instead of once per test case. A worker that times out or dies is
+    replaced before the next test case.
+    
+    With in_process=True (default: JUDGE_IN_PROCESS) trusted code is run in
+    this process instead, when called from the main thread on a platform
+    with SIGALRM; otherwise the subprocess path is used.
+    
+    Returns:
+        One (passed: bool, output: str, error: str or None) per test case
+    """
+    func_name = _find_function_name(code_string)
+    
+    if in_process is None:
+        in_process = JUDGE_IN_PROCESS
+    if in_process and _in_process_available():
+        return _run_test_cases_in_process(code_string, func_name, test_cases)
+    
+    results = []
+    worker = None
+    
+    try:
+        for test_case in test_cases:
+            test_input = test_case.get("input", {})
+            
+            if not isinstance(test_input, dict):
+                results.append((False, "", "Invalid test case format"))
+                continue
+            if not func_name:
+                results.append((False, "", "Could not find function definition"))
+                continue
+            
+            try:
+                if worker is None:
+                    worker = _JudgeWorker(code_string, func_name)
+                output, error = worker.run(test_input)
+            except TimeoutError:
+                worker.kill()
+                worker = None
+                results.append((False, "", TIMEOUT_ERROR))
+                continue
+            except Exception as e:
+                if worker is not None:
+                    worker.kill()
+                    worker = None
+                results.append((False, "", f"Execution error: {str(e)}"))
+                continue
+            
+            results.append((_outputs_match(output, test_case.get("output")), output, error))
+    finally:
+        if worker is not None:
+            worker.close()
+    
+    return results
 
 
 def execute_code(code_string: str, test_case: Dict[str, Any]) -> Tuple[bool, str, Any]:
@@ -17,82 +258,60 @@ def execute_code(code_string: str, test_case: Dict[str, Any]) -> Tuple[bool, str
     Returns:
         (passed: bool, output: str, error: str or None)
     """
-    temp_file = None
-    try:
-        # Create temporary file
-        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".py", encoding='utf-8')
-        
-        # Write the applicant's code
-        temp_file.write(code_string)
-        temp_file.write("\n\n# AUTO-GENERATED TEST CODE\n")
-        
-        # Extract input and expected output
-        test_input = test_case.get("input", {})
-        expected_output = test_case.get("output")
-        
-        # Generate function call code
-        if isinstance(test_input, dict):
-            # Named parameters
-            args_str = ", ".join([f"{k}={repr(v)}" for k, v in test_input.items()])
-            # Extract function name
-            lines = code_string.split('\n')
-            func_name = None
-            for line in lines:
-                if line.strip().startswith('def '):
-                    func_name = line.split('(')[0].replace('def ', '').strip()
-                    break
-            
-            if func_name:
-                test_code = f"""
-import json
-try:
-    result = {func_name}({args_str})
-    print(json.dumps(result, default=str))
-except Exception as e:
-    print(f"ERROR: {{str(e)}}")
-"""
-            else:
-                return False, "", "Could not find function definition"
-        else:
-            return False, "", "Invalid test case format"
-        
-        temp_file.write(test_code)
-        temp_file.close()
-        
-        # Execute the temporary file
-        result = subprocess.run(
-            [sys.executable, temp_file.name],
-            capture_output=True,
-            timeout=5,
-            text=True
-        )
-        
-        output = result.stdout.strip()
-        error = result.stderr.strip() if result.stderr else None
-        
-        # Check if output matches expected
-        try:
-            actual_output = json.loads(output) if output and not output.startswith("ERROR") else output
-            expected_json = json.dumps(expected_output) if isinstance(expected_output, (dict, list)) else str(expected_output)
-            actual_json = json.dumps(actual_output) if isinstance(actual_output, (dict, list)) else str(actual_output)
-            
-            passed = actual_json == expected_json or str(actual_output) == str(expected_output)
-        except:
-            passed = output == str(expected_output)
-        
-        return passed, output, error
+    return run_test_cases(code_string, [test_case])[0]
+
+
+def grade_question(question: Dict, code: str) -> Tuple[int, int, List[Dict]]:
+    """
+    Run one submitted solution against all test cases of its question.
+    
+    Args:
+        question: Question dict with test_cases
+        code: Submitted code string
+    
+    Returns:
+        Tuple of (passed_tests, total_tests, results: list of test result details)
+    """
+    q_id = question.get("id")
+    test_cases = question.get("test_cases", [])
+    
+    total_passed = 0
+    results = []
+    
+    for test_case, (passed, output, error) in zip(test_cases, run_test_cases(code, test_cases)):
+        if passed:
+            total_passed += 1
         
-    except subprocess.TimeoutExpired:
-        return False, "", "TIMEOUT: Code took too long to execute (>5 seconds)"
-    except Exception as e:
-        return False, "", f"Execution error: {str(e)}"
-    finally:
-        # Clean up temporary file
-        if temp_file and os.path.exists(temp_file.name):
-            try:
-                os.remove(temp_file.name)
-            except:
-                pass
+        results.append({
+            "question_id": q_id,
+            "title": question.get("title", "Unknown"),
+            "passed": passed,
+            "output": output,
+            "error": error,
+            "expected": test_case.get("output")
+        })
+    
+    return total_passed, len(test_cases), results
+
+
+def combine_question_grades(grades: List[Tuple[int, int, List[Dict]]]) -> Tuple[int, List[Dict]]:
+    """
+    Combine per-question grades (in question order) into (score, results).
+    """
+    total_passed = 0
+    total_tests = 0
+    results = []
+    
+    for passed, total, question_results in grades:
+        total_passed += passed
+        total_tests += total
+        results.extend(question_results)
+    
+    if total_tests == 0:
+        return 0, []
+    
+    score = int((total_passed / total_tests) * 100)
+    return score, results
 
 
 def score_coding_answers(questions: List[Dict], answers: List[Dict]) -> Tuple[int, List[Dict]]:
@@ -109,42 +328,29 @@ def score_coding_answers(questions: List[Dict], answers: List[Dict]) -> Tuple[in
     if not questions or not answers:
         return 0, []
     
-    total_passed = 0
-    total_tests = 0
-    results = []
-    
     # Create a map of answers by question_id
     answer_map = {a["question_id"]: a["answer"] for a in answers}
     
+    graded_questions = []
+    codes = []
     for question in questions:
-        q_id = question.get("id")
-        code = answer_map.get(q_id, "")
-        test_cases = question.get("test_cases", [])
+        code = answer_map.get(question.get("id"), "")
         
-        if not code or not test_cases:
+        if not code or not question.get("test_cases"):
             continue
         
-        for test_case in test_cases:
-            total_tests += 1
-            passed, output, error = execute_code(code, test_case)
-            
-            if passed:
-                total_passed += 1
-            
-            results.append({
-                "question_id": q_id,
-                "title": question.get("title", "Unknown"),
-                "passed": passed,
-                "output": output,
-                "error": error,
-                "expected": test_case.get("output")
-            })
+        graded_questions.append(question)
+        codes.append(code)
     
-    if total_tests == 0:
-        return 0, []
+    # Questions run in separate worker subprocesses, so grade them concurrently
+    # (in-process mode needs the main thread, so it grades them one by one)
+    if len(codes) > 1 and not JUDGE_IN_PROCESS:
+        with ThreadPoolExecutor(max_workers=min(len(codes), os.cpu_count() or 1)) as executor:
+            grades = list(executor.map(grade_question, graded_questions, codes))
+    else:
+        grades = [grade_question(q, c) for q, c in zip(graded_questions, codes)]
     
-    score = int((total_passed / total_tests) * 100)
-    return score, results
+    return combine_question_grades(grades)
 
 
 def score_resume(resume_path: str) -> int:
@@ -158,32 +364,41 @@ def score_resume(resume_path: str) -> int:
     Returns:
         Score (0-100) based on resume analysis
     """
+    return score_resume_with_status(resume_path)[0]
+
+
+def score_resume_with_status(resume_path: str) -> Tuple[int, bool]:
+    """
+    score_resume plus whether the score is complete. It is False when a
+    fallback was used because of the environment (scorer imports or the
+    embedding model unavailable), so the score should not be cached.
+    """
     if not resume_path or not os.path.exists(resume_path):
-        return 0
+        return 0, False
     
     try:
         # Import locally to avoid import errors
         sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
         from resume.parser import extract_text
         from resume.skill_extractor import extract_skills, extract_experience, count_projects
-        from resume.scorer import score_candidate
+        from resume.scorer import score_candidate_with_status
     except ImportError as e:
         # Fallback scoring if imports fail
         try:
             size_kb = os.path.getsize(resume_path) / 1024.0
-            return min(int(size_kb * 2), 100)
+            return min(int(size_kb * 2), 100), False
         except:
-            return 50
+            return 50, False
     
     # Extract text from resume
     try:
         resume_text = extract_text(resume_path)
     except Exception as e:
         print(f"Error parsing resume: {e}")
-        return 25
+        return 25, True
     
     if not resume_text:
-        return 20
+        return 20, True
     
     # Extract information from resume
     skills = extract_skills(resume_text)
@@ -204,15 +419,16 @@ def score_resume(resume_path: str) -> int:
     
     # Calculate score
     try:
-        score = score_candidate(data, job_config)
+        score, complete = score_candidate_with_status(data, job_config)
     except Exception as e:
+        complete = False
         # Calculate manually if scorer fails
         skill_score = min(len(skills), 5) / 5 * 50  # 50 points for skills
         exp_score = min(experience / job_config["min_exp"], 1) * 25  # 25 points for experience
         project_score = min(projects, 5) / 5 * 25  # 25 points for projects
         score = skill_score + exp_score + project_score
     
-    return int(min(max(score, 0), 100))
+    return int(min(max(score, 0), 100)), complete
 
 
 def get_test_results_summary(results: List[Dict]) -> Dict[str, Any]:
@@ -2,6 +2,11 @@ import json
 import os
 import random
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional: fall back to the standard library parser
+    _json_loads = json.loads
+
 
 BASE_DIR = os.path.dirname(__file__)
 QUESTIONS_PATH = os.path.join(BASE_DIR, "questions.json")
@@ -12,12 +17,33 @@ def _load_questions():
     if not os.path.exists(QUESTIONS_PATH):
         return []
 
-    with open(QUESTIONS_PATH, encoding="utf-8") as f:
-        return json.load(f)
+    with open(QUESTIONS_PATH, "rb") as f:
+        return _json_loads(f.read())
+
+
+def to_ui_question(q):
+    """Project a stored question onto the fields shown in the UI."""
+    return {
+        "id": q.get("id"),
+        "question": q.get("description") or q.get("title"),  # Use description, fallback to title
+        "title": q.get("title"),
+        "difficulty": q.get("difficulty"),
+        "function_signature": q.get("function_signature"),
+        "topic": q.get("topic")
+    }
 
 
 QUESTIONS = _load_questions()
 
+# UI view of every question, built once at load time and keyed by id
+QUESTIONS_UI = {q.get("id"): to_ui_question(q) for q in QUESTIONS}
+
+# Questions bucketed by difficulty once, so selection is a dict lookup
+_BY_LEVEL = {
+    level: [q for q in QUESTIONS if q.get("difficulty") == level]
+    for level in ("easy", "medium", "hard")
+}
+
 
 def select_questions(score, n=3):
     """
@@ -36,11 +62,10 @@ def select_questions(score, n=3):
     else:
         level = "easy"
 
-    pool = [q for q in QUESTIONS if q.get("difficulty") == level]
+    pool = _BY_LEVEL[level]
 
     if not pool:
         pool = QUESTIONS
 
-    chosen = random.sample(pool, min(n, len(pool)))
-    random.shuffle(chosen)
-    return chosen
\ No newline at end of file
+    # random.sample already returns the picks in random order
+    return random.sample(pool, min(n, len(pool)))
\ No newline at end of file
@@ -1,12 +1,20 @@
 # explain.py
 
 
-def generate_explanation(score, data, job_config):
+def generate_explanation(score, data, job_config, required=None):
+    """
+    required: optional prebuilt set(job_config["skills"]), so callers
+    explaining many candidates for one job build it only once
+    """
 
     reasons = []
 
-    matched = list(set(data["skills"]) & set(job_config["skills"]))
-    missing = list(set(job_config["skills"]) - set(data["skills"]))
+    candidate = set(data["skills"])
+    if required is None:
+        required = set(job_config["skills"])
+
+    matched = list(candidate & required)
+    missing = list(required - candidate)
 
     if matched:
         reasons.append(f"✓ Matched skills: {', '.join(matched)}")
@@ -19,13 +19,28 @@ def extract_text(file_path: str) -> str:
 
 
 def _from_pdf(path):
-    text = ""
+    try:
+        import pymupdf  # optional (AGPL): C-backed, much faster than pdfplumber
+    except ImportError:
+        return _from_pdf_pdfplumber(path)
+
+    try:
+        with pymupdf.open(path) as doc:
+            return "\n".join(page.get_text().lower() for page in doc)
+    except Exception:
+        # Files MuPDF can't read get a second chance with pdfplumber
+        return _from_pdf_pdfplumber(path)
+
+
+def _from_pdf_pdfplumber(path):
+    parts = []
     with pdfplumber.open(path) as pdf:
         for page in pdf.pages:
-            text += page.extract_text() + "\n"
-    return text.lower()
+            parts.append((page.extract_text() or "").lower())
+            parts.append("\n")
+    return "".join(parts)
 
 
 def _from_docx(path):
     doc = docx.Document(path)
-    return "\n".join(p.text for p in doc.paragraphs).lower()
\ No newline at end of file
+    return "\n".join(p.text.lower() for p in doc.paragraphs)
\ No newline at end of file
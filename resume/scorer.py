@@ -1,7 +1,8 @@
 # scorer.py
 
 import logging
-from sentence_transformers import SentenceTransformer, util
+import functools
+from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
@@ -9,13 +10,30 @@ logger = logging.getLogger(__name__)
 _model = None
 
 
+def _quantize_model(model):
+    """Swap the transformer's Linear layers for dynamic int8 ones (CPU only)"""
+    if model.device.type != "cpu":
+        return model
+
+    try:
+        import torch
+        transformer = model[0]
+        transformer.auto_model = torch.ao.quantization.quantize_dynamic(
+            transformer.auto_model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        logger.info("Model quantized to int8")
+    except Exception as e:
+        logger.warning(f"Int8 quantization failed, using FP32 model: {e}")
+    return model
+
+
 def get_model():
     """Lazy load the model on first use"""
     global _model
     if _model is None:
         try:
             logger.info("Loading sentence transformer model...")
-            _model = SentenceTransformer("all-MiniLM-L6-v2")
+            _model = _quantize_model(SentenceTransformer("all-MiniLM-L6-v2"))
             logger.info("Model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
@@ -23,21 +41,57 @@ def get_model():
     return _model
 
 
-def semantic_similarity(candidate_skills, required_skills):
+@functools.lru_cache(maxsize=32)
+def _encode_required(required_skills):
+    """Normalized embedding of a job's required skills, cached per skills tuple"""
+    model = get_model()
+    return model.encode(" ".join(required_skills), convert_to_tensor=True, normalize_embeddings=True)
+
+
+def _similarity_with_status(candidate_skills, required_skills):
+    """semantic_similarity plus False if it fell back to 0 because the model failed"""
     try:
         if not candidate_skills:
-            return 0
+            return 0, True
 
         model = get_model()
-        cand_embed = model.encode(" ".join(candidate_skills), convert_to_tensor=True)
-        req_embed = model.encode(" ".join(required_skills), convert_to_tensor=True)
+        cand_embed = model.encode(" ".join(candidate_skills), convert_to_tensor=True, normalize_embeddings=True)
+        req_embed = _encode_required(tuple(required_skills))
 
-        score = util.cos_sim(cand_embed, req_embed).item()
+        # Both embeddings are unit length, so the dot product is the cosine similarity
+        score = (cand_embed @ req_embed).item()
 
-        return max(score, 0)
+        return max(score, 0), True
     except Exception as e:
         logger.error(f"Error computing semantic similarity: {e}")
-        return 0
+        return 0, False
+
+
+def semantic_similarity(candidate_skills, required_skills):
+    return _similarity_with_status(candidate_skills, required_skills)[0]
+
+
+def batch_semantic_similarity(candidates_skills, required_skills):
+    """semantic_similarity for many candidates with one batched encode call"""
+    sims = [0] * len(candidates_skills)
+    try:
+        indexed = [i for i, skills in enumerate(candidates_skills) if skills]
+        if not indexed:
+            return sims
+
+        model = get_model()
+        cand_embeds = model.encode(
+            [" ".join(candidates_skills[i]) for i in indexed],
+            batch_size=32, convert_to_tensor=True, normalize_embeddings=True
+        )
+        req_embed = _encode_required(tuple(required_skills))
+
+        for i, score in zip(indexed, (cand_embeds @ req_embed).clamp(min=0).tolist()):
+            sims[i] = score
+        return sims
+    except Exception as e:
+        logger.error(f"Error computing batch semantic similarity: {e}")
+        return [0] * len(candidates_skills)
 
 
 def score_candidate(data, job_config):
@@ -50,9 +104,39 @@ def score_candidate(data, job_config):
         projects
     }
     """
+    return score_candidate_with_status(data, job_config)[0]
+
+
+def score_candidate_with_status(data, job_config):
+    """
+    score_candidate plus whether the score is complete: False when the
+    embedding model was unavailable and the skill match fell back to 0
+    """
+    try:
+        skill_sim, complete = _similarity_with_status(data["skills"], job_config["skills"])
+    except Exception as e:
+        logger.error(f"Error scoring candidate: {e}")
+        return 0, False
+
+    return _score_from_similarity(skill_sim, data, job_config), complete
+
+
+def score_candidates_batch(list_of_data, job_config):
+    """
+    Score many candidates for one job, in order.
+    Same result as score_candidate per item, but one model forward pass.
+    """
     try:
-        skill_sim = semantic_similarity(data["skills"], job_config["skills"])
+        sims = batch_semantic_similarity([data["skills"] for data in list_of_data], job_config["skills"])
+    except Exception as e:
+        logger.error(f"Error scoring candidates: {e}")
+        return [0] * len(list_of_data)
+
+    return [_score_from_similarity(sim, data, job_config) for sim, data in zip(sims, list_of_data)]
 
+
+def _score_from_similarity(skill_sim, data, job_config):
+    try:
         skill_score = skill_sim * 50
 
         exp_score = min(data["experience"] / job_config["min_exp"], 1) * 25
@@ -14,13 +14,11 @@ KNOWN_SKILLS = [
 
 
 def extract_skills(text: str):
-    found = []
+    # KNOWN_SKILLS has no duplicates, so no set() round-trip is needed
+    return [skill for skill in KNOWN_SKILLS if skill in text]
 
-    for skill in KNOWN_SKILLS:
-        if skill in text:
-            found.append(skill)
 
-    return list(set(found))
+_EXP_RE = re.compile(r'(\d+)\s*\+?\s*(?:years|yrs)')
 
 
 def extract_experience(text: str):
@@ -30,13 +28,7 @@ def extract_experience(text: str):
     2+ years
     5 yrs
     """
-    matches = re.findall(r'(\d+)\s*\+?\s*(years|yrs)', text)
-
-    if not matches:
-        return 0
-
-    years = [int(m[0]) for m in matches]
-    return max(years)
+    return max((int(years) for years in _EXP_RE.findall(text)), default=0)
 
 
 def count_projects(text: str):